@@ -50,6 +50,15 @@ DISABLE_DANSWER_BOT_FILTER_DETECT = (
 ENABLE_DANSWERBOT_REFLEXION = (
     os.environ.get("ENABLE_DANSWERBOT_REFLEXION", "").lower() == "true"
 )
+# Post the answer as soon as the LLM starts generating it and keep updating that message
+# until it is done, instead of only responding once the full answer is ready.
+# Not used for ephemeral responses (cannot be edited) or with reflexion (answer may be thrown out)
+DANSWER_BOT_STREAM_ANSWERS = (
+    os.environ.get("DANSWER_BOT_STREAM_ANSWERS", "").lower() == "true"
+)
+# Minimum number of seconds between updates of a streamed answer, Slack rate limits
+# chat.update to about once per second per message
+DANSWER_BOT_STREAM_UPDATE_INTERVAL = 1.0
 # Currently not support chain of thought, probably will add back later
 DANSWER_BOT_DISABLE_COT = True
 
@@ -276,6 +276,16 @@ def build_qa_response_blocks(
     return response_blocks
 
 
+def build_streaming_answer_blocks(partial_answer: str) -> list[Block]:
+    """Blocks shown while the answer is still being generated. Keeps the same header +
+    answer structure as the final response since the thread reading logic relies on it"""
+    answer_processed = decode_escapes(remove_slack_text_interactions(partial_answer))
+    return [
+        HeaderBlock(text="AI Answer"),
+        SectionBlock(text=answer_processed + " ..."),
+    ]
+
+
 def build_follow_up_block(message_id: int | None) -> ActionsBlock:
     return ActionsBlock(
         block_id=build_feedback_id(message_id) if message_id is not None else None,
@@ -17,7 +17,11 @@ def get_slack_bot_config_for_channel(
     if not channel_name:
         return None
 
-    slack_bot_configs = fetch_slack_bot_configs(db_session=db_session)
+    # The persona details are needed to answer every message in the channel, so load
+    # them upfront rather than lazily one relationship at a time
+    slack_bot_configs = fetch_slack_bot_configs(
+        db_session=db_session, eager_load_persona=True
+    )
     for config in slack_bot_configs:
         if channel_name in config.channel_config["channel_names"]:
             return config
@@ -6,3 +6,5 @@ FOLLOWUP_BUTTON_ACTION_ID = "followup-button"
 FOLLOWUP_BUTTON_RESOLVED_ACTION_ID = "followup-resolved-button"
 SLACK_CHANNEL_ID = "channel_id"
 VIEW_DOC_FEEDBACK_ID = "view-doc-feedback"
+# Slack rejects messages with more blocks than this
+SLACK_MAX_BLOCKS_PER_MESSAGE = 50
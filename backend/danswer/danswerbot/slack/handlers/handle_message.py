@@ -1,12 +1,12 @@
 import functools
 import logging
+import time
 from collections.abc import Callable
 from typing import Any
 from typing import cast
 from typing import Optional
 from typing import TypeVar
 
-from retry import retry
 from slack_sdk import WebClient
 from slack_sdk.errors import SlackApiError
 from sqlalchemy.orm import Session
@@ -16,7 +16,10 @@ from danswer.configs.danswerbot_configs import DANSWER_BOT_ANSWER_GENERATION_TIM
 from danswer.configs.danswerbot_configs import DANSWER_BOT_DISABLE_COT
 from danswer.configs.danswerbot_configs import DANSWER_BOT_DISABLE_DOCS_ONLY_ANSWER
 from danswer.configs.danswerbot_configs import DANSWER_BOT_DISPLAY_ERROR_MSGS
+from danswer.configs.danswerbot_configs import DANSWER_BOT_NUM_DOCS_TO_DISPLAY
 from danswer.configs.danswerbot_configs import DANSWER_BOT_NUM_RETRIES
+from danswer.configs.danswerbot_configs import DANSWER_BOT_STREAM_ANSWERS
+from danswer.configs.danswerbot_configs import DANSWER_BOT_STREAM_UPDATE_INTERVAL
 from danswer.configs.danswerbot_configs import DANSWER_BOT_TARGET_CHUNK_PERCENTAGE
 from danswer.configs.danswerbot_configs import DANSWER_REACT_EMOJI
 from danswer.configs.danswerbot_configs import DISABLE_DANSWER_BOT_FILTER_DETECT
@@ -25,15 +28,20 @@ from danswer.configs.model_configs import GEN_AI_MODEL_VERSION
 from danswer.danswerbot.slack.blocks import build_documents_blocks
 from danswer.danswerbot.slack.blocks import build_follow_up_block
 from danswer.danswerbot.slack.blocks import build_qa_response_blocks
+from danswer.danswerbot.slack.blocks import build_streaming_answer_blocks
 from danswer.danswerbot.slack.blocks import get_restate_blocks
 from danswer.danswerbot.slack.constants import SLACK_CHANNEL_ID
+from danswer.danswerbot.slack.constants import SLACK_MAX_BLOCKS_PER_MESSAGE
 from danswer.danswerbot.slack.models import SlackMessageInfo
 from danswer.danswerbot.slack.utils import ChannelIdAdapter
+from danswer.danswerbot.slack.utils import delete_message
 from danswer.danswerbot.slack.utils import fetch_userids_from_emails
 from danswer.danswerbot.slack.utils import respond_in_thread
+from danswer.danswerbot.slack.utils import retry_within_deadline
 from danswer.danswerbot.slack.utils import slack_usage_report
 from danswer.danswerbot.slack.utils import SlackRateLimiter
 from danswer.danswerbot.slack.utils import update_emote_react
+from danswer.danswerbot.slack.utils import update_message
 from danswer.db.engine import get_sqlalchemy_engine
 from danswer.db.models import SlackBotConfig
 from danswer.llm.utils import check_number_of_tokens
@@ -45,6 +53,8 @@ from danswer.search.models import BaseFilters
 from danswer.search.models import OptionalSearchSetting
 from danswer.search.models import RetrievalDetails
 from danswer.utils.logger import setup_logger
+from danswer.utils.threadpool_concurrency import FunctionCall
+from danswer.utils.threadpool_concurrency import run_functions_in_parallel
 
 logger_base = setup_logger()
 
@@ -53,18 +63,25 @@ srl = SlackRateLimiter()
 RT = TypeVar("RT")  # return type
 
 
+@functools.lru_cache(maxsize=1024)
+def get_channel_logger(channel: str) -> logging.Logger:
+    """One logger adapter per channel rather than building a new one for every message"""
+    return cast(
+        logging.Logger,
+        ChannelIdAdapter(logger_base, extra={SLACK_CHANNEL_ID: channel}),
+    )
+
+
 def rate_limits(
     client: WebClient, channel: str, thread_ts: Optional[str]
 ) -> Callable[[Callable[..., RT]], Callable[..., RT]]:
     def decorator(func: Callable[..., RT]) -> Callable[..., RT]:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> RT:
-            if not srl.is_available():
+            if not srl.try_acquire_slot():
                 func_randid, position = srl.init_waiter()
                 srl.notify(client, channel, position, thread_ts)
-                while not srl.is_available():
-                    srl.waiter(func_randid)
-            srl.acquire_slot()
+                srl.waiter(func_randid)
             return func(*args, **kwargs)
 
         return wrapper
@@ -72,6 +89,106 @@ def rate_limits(
     return decorator
 
 
+class SlackAnswerStreamer:
+    """Posts the answer as it is being generated and keeps updating that same message.
+    Updates are throttled to respect Slack's chat.update rate limits. Streaming is best
+    effort: the updates are only a progress display and run inside the answer generation
+    loop, so they are never retried (which would sleep on rate limits). If a Slack call
+    fails, streaming stops and the final response replaces whatever was posted"""
+
+    def __init__(
+        self,
+        client: WebClient,
+        channel: str,
+        thread_ts: str | None,
+        logger: logging.Logger,
+        update_interval: float = DANSWER_BOT_STREAM_UPDATE_INTERVAL,
+    ) -> None:
+        self.client = client
+        self.channel = channel
+        self.thread_ts = thread_ts
+        self.logger = logger
+        self.update_interval = update_interval
+        self.message_ts: str | None = None
+        self._partial_answer = ""
+        self._last_update_time = 0.0
+        self._failed = False
+
+    def reset(self) -> None:
+        """Start over for a new answer attempt, the posted message (if any) is reused"""
+        self._partial_answer = ""
+        self._last_update_time = 0.0
+
+    def add_answer_piece(self, answer_piece: str) -> None:
+        self._partial_answer += answer_piece
+        if self._failed:
+            return
+
+        now = time.monotonic()
+        if now - self._last_update_time < self.update_interval:
+            return
+        self._last_update_time = now
+
+        blocks = build_streaming_answer_blocks(self._partial_answer)
+        try:
+            if self.message_ts is None:
+                response = self.client.chat_postMessage(
+                    channel=self.channel,
+                    thread_ts=self.thread_ts,
+                    text="Danswer is generating an answer for you...",
+                    blocks=blocks,
+                )
+                self.message_ts = cast(str, response["ts"])
+            else:
+                self.client.chat_update(
+                    channel=self.channel,
+                    ts=self.message_ts,
+                    text="Danswer is generating an answer for you...",
+                    blocks=blocks,
+                )
+        except Exception as e:
+            self.logger.error(f"Failed to stream answer to Slack due to: {e}")
+            self._failed = True
+
+    def clean_up(self) -> None:
+        """Removes the partial answer message, used if no final answer will be given"""
+        if self.message_ts is None:
+            return
+
+        try:
+            delete_message(
+                client=self.client, channel=self.channel, message_ts=self.message_ts
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to delete partially streamed answer due to: {e}")
+        self.message_ts = None
+
+
+@functools.lru_cache()
+def get_slack_retrieval_details(
+    document_set_names: tuple[str, ...] | None, enable_auto_detect_filters: bool
+) -> RetrievalDetails:
+    """The retrieval options only depend on the channel's config, so the same object is
+    shared across all messages of channels with the same config. It must not be mutated,
+    retrieval_preprocessing copies the filters before applying the Persona defaults"""
+    # By leaving time_cutoff and favor_recent as None, and setting enable_auto_detect_filters
+    # it allows the slack flow to extract out filters from the user query
+    filters = BaseFilters(
+        source_type=None,
+        document_set=list(document_set_names)
+        if document_set_names is not None
+        else None,
+        time_cutoff=None,
+    )
+
+    return RetrievalDetails(
+        run_search=OptionalSearchSetting.ALWAYS,
+        real_time=False,
+        filters=filters,
+        enable_auto_detect_filters=enable_auto_detect_filters,
+    )
+
+
 def send_msg_ack_to_user(details: SlackMessageInfo, client: WebClient) -> None:
     if details.is_bot_msg and details.sender:
         respond_in_thread(
@@ -92,6 +209,23 @@ def send_msg_ack_to_user(details: SlackMessageInfo, client: WebClient) -> None:
     )
 
 
+def remove_msg_ack_from_user(
+    details: SlackMessageInfo, client: WebClient, logger: logging.Logger
+) -> None:
+    """Removes the reaction added by `send_msg_ack_to_user`, failures are only logged
+    since they should never block responding to the user"""
+    try:
+        update_emote_react(
+            emoji=DANSWER_REACT_EMOJI,
+            channel=details.channel_to_respond,
+            message_ts=details.msg_to_respond,
+            remove=True,
+            client=client,
+        )
+    except Exception as e:
+        logger.error(f"Failed to remove Reaction due to: {e}")
+
+
 def handle_message(
     message_info: SlackMessageInfo,
     channel_config: SlackBotConfig | None,
@@ -104,6 +238,8 @@ def handle_message(
     reflexion: bool = ENABLE_DANSWERBOT_REFLEXION,
     disable_cot: bool = DANSWER_BOT_DISABLE_COT,
     thread_context_percent: float = DANSWER_BOT_TARGET_CHUNK_PERCENTAGE,
+    stream_answers: bool = DANSWER_BOT_STREAM_ANSWERS,
+    num_docs_to_display: int = DANSWER_BOT_NUM_DOCS_TO_DISPLAY,
 ) -> bool:
     """Potentially respond to the user message depending on filters and if an answer was generated
 
@@ -114,10 +250,7 @@ def handle_message(
     """
     channel = message_info.channel_to_respond
 
-    logger = cast(
-        logging.Logger,
-        ChannelIdAdapter(logger_base, extra={SLACK_CHANNEL_ID: channel}),
-    )
+    logger = get_channel_logger(channel)
 
     messages = message_info.thread_messages
     message_ts_to_respond_to = message_info.msg_to_respond
@@ -126,32 +259,15 @@ def handle_message(
     is_bot_msg = message_info.is_bot_msg
     is_bot_dm = message_info.is_bot_dm
 
-    document_set_names: list[str] | None = None
-    persona = channel_config.persona if channel_config else None
-    prompt = None
-    if persona:
-        document_set_names = [
-            document_set.name for document_set in persona.document_sets
-        ]
-        prompt = persona.prompts[0] if persona.prompts else None
-
-    should_respond_even_with_no_docs = persona.num_chunks == 0 if persona else False
+    last_message = messages[-1].message
 
     # List of user id to send message to, if None, send to everyone in channel
     send_to: list[str] | None = None
     respond_tag_only = False
     respond_team_member_list = None
 
-    bypass_acl = False
-    if (
-        channel_config
-        and channel_config.persona
-        and channel_config.persona.document_sets
-    ):
-        # For Slack channels, use the full document set, admin will be warned when configuring it
-        # with non-public document sets
-        bypass_acl = True
-
+    # Apply the cheap config based filters first so that messages which are thrown out
+    # don't cost any Slack API calls or persona lookups
     channel_conf = None
     if channel_config and channel_config.channel_config:
         channel_conf = channel_config.channel_config
@@ -160,19 +276,13 @@ def handle_message(
 
             if (
                 "questionmark_prefilter" in channel_conf["answer_filters"]
-                and "?" not in messages[-1].message
+                and "?" not in last_message
             ):
                 logger.info(
                     "Skipping message since it does not contain a question mark"
                 )
                 return False
 
-        logger.info(
-            "Found slack bot config for channel. Restricting bot to use document "
-            f"sets: {document_set_names}, "
-            f"validity checks enabled: {channel_conf.get('answer_filters', 'NA')}"
-        )
-
         respond_tag_only = channel_conf.get("respond_tag_only") or False
         respond_team_member_list = channel_conf.get("respond_team_member_list") or None
 
@@ -183,30 +293,90 @@ def handle_message(
         )
         return False
 
-    if respond_team_member_list:
-        send_to, _ = fetch_userids_from_emails(respond_team_member_list, client)
+    document_set_names: list[str] | None = None
+    persona = channel_config.persona if channel_config else None
+    prompt = None
+    if persona:
+        document_set_names = [
+            document_set.name for document_set in persona.document_sets
+        ]
+        prompt = persona.prompts[0] if persona.prompts else None
+
+    should_respond_even_with_no_docs = persona.num_chunks == 0 if persona else False
+
+    bypass_acl = False
+    if persona and persona.document_sets:
+        # For Slack channels, use the full document set, admin will be warned when configuring it
+        # with non-public document sets
+        bypass_acl = True
+
+    if channel_conf:
+        logger.info(
+            "Found slack bot config for channel. Restricting bot to use document "
+            f"sets: {document_set_names}, "
+            f"validity checks enabled: {channel_conf.get('answer_filters', 'NA')}"
+        )
+
+    def _ack_message() -> None:
+        try:
+            send_msg_ack_to_user(message_info, client)
+        except SlackApiError as e:
+            logger.error(f"Was not able to react to user message due to: {e}")
+
+    # The Slack calls below are independent of each other, so run them in parallel
+    # to only pay for the slowest round-trip instead of the sum of them
+    ack_call = FunctionCall(_ack_message)
+    fetch_userids_call = (
+        FunctionCall(fetch_userids_from_emails, (respond_team_member_list, client))
+        if respond_team_member_list
+        else None
+    )
 
     # If configured to respond to team members only, then cannot be used with a /DanswerBot command
     # which would just respond to the sender
-    if respond_team_member_list and is_bot_msg:
-        if sender_id:
-            respond_in_thread(
-                client=client,
-                channel=channel,
-                receiver_ids=[sender_id],
-                text="The DanswerBot slash command is not enabled for this channel",
-                thread_ts=None,
-            )
+    slash_not_enabled_call = (
+        FunctionCall(
+            respond_in_thread,
+            kwargs={
+                "client": client,
+                "channel": channel,
+                "receiver_ids": [sender_id],
+                "text": "The DanswerBot slash command is not enabled for this channel",
+                "thread_ts": None,
+            },
+        )
+        if respond_team_member_list and is_bot_msg and sender_id
+        else None
+    )
 
-    try:
-        send_msg_ack_to_user(message_info, client)
-    except SlackApiError as e:
-        logger.error(f"Was not able to react to user message due to: {e}")
+    initial_results = run_functions_in_parallel(
+        [
+            call
+            for call in [ack_call, fetch_userids_call, slash_not_enabled_call]
+            if call
+        ]
+    )
+    if fetch_userids_call:
+        send_to, _ = initial_results[fetch_userids_call.result_id]
 
-    @retry(
+    # Ephemeral messages can't be updated and with reflexion the answer may be thrown out
+    # after it is generated, so only stream in the other cases
+    answer_streamer = (
+        SlackAnswerStreamer(
+            client=client,
+            channel=channel,
+            thread_ts=message_ts_to_respond_to,
+            logger=logger,
+        )
+        if stream_answers and not send_to and not reflexion
+        else None
+    )
+
+    # Each attempt runs the full retrieval + LLM flow, so don't keep retrying past the time
+    # a single answer is allowed to take
+    @retry_within_deadline(
         tries=num_retries,
-        delay=0.25,
-        backoff=2,
+        deadline=answer_generation_timeout,
         logger=logger,
     )
     @rate_limits(client=client, channel=channel, thread_ts=message_ts_to_respond_to)
@@ -221,6 +391,9 @@ def handle_message(
 
         slack_usage_report(action=action, sender_id=sender_id, client=client)
 
+        if answer_streamer is not None:
+            answer_streamer.reset()
+
         max_document_tokens: int | None = None
         max_history_tokens: int | None = None
         if len(new_message_request.messages) > 1:
@@ -244,7 +417,9 @@ def handle_message(
                     - check_number_of_tokens(query_text)
                 )
 
-        with Session(get_sqlalchemy_engine()) as db_session:
+        # The answer flow commits several times (chat session, messages), don't expire the
+        # loaded objects on each commit as that causes them to be re-selected on next access
+        with Session(get_sqlalchemy_engine(), expire_on_commit=False) as db_session:
             # This also handles creating the query event in postgres
             answer = get_search_answer(
                 query_req=new_message_request,
@@ -255,6 +430,9 @@ def handle_message(
                 answer_generation_timeout=answer_generation_timeout,
                 enable_reflexion=reflexion,
                 bypass_acl=bypass_acl,
+                answer_piece_callback=answer_streamer.add_answer_piece
+                if answer_streamer is not None
+                else None,
             )
             if not answer.error_msg:
                 return answer
@@ -262,14 +440,6 @@ def handle_message(
                 raise RuntimeError(answer.error_msg)
 
     try:
-        # By leaving time_cutoff and favor_recent as None, and setting enable_auto_detect_filters
-        # it allows the slack flow to extract out filters from the user query
-        filters = BaseFilters(
-            source_type=None,
-            document_set=document_set_names,
-            time_cutoff=None,
-        )
-
         # Default True because no other ways to apply filters in Slack (no nice UI)
         auto_detect_filters = (
             persona.llm_filter_extraction if persona is not None else True
@@ -277,16 +447,17 @@ def handle_message(
         if disable_auto_detect_filters:
             auto_detect_filters = False
 
-        retrieval_details = RetrievalDetails(
-            run_search=OptionalSearchSetting.ALWAYS,
-            real_time=False,
-            filters=filters,
+        retrieval_details = get_slack_retrieval_details(
+            document_set_names=tuple(document_set_names)
+            if document_set_names is not None
+            else None,
             enable_auto_detect_filters=auto_detect_filters,
         )
 
-        # This includes throwing out answer via reflexion
+        # All of the inputs are already validated models / DB values, so skip re-validating
+        # (and deep copying) them. This includes throwing out answer via reflexion
         answer = _get_answer(
-            DirectQARequest(
+            DirectQARequest.construct(
                 messages=messages,
                 prompt_id=prompt.id if prompt else None,
                 persona_id=persona.id if persona is not None else 0,
@@ -299,42 +470,42 @@ def handle_message(
             f"Unable to process message - did not successfully answer "
             f"in {num_retries} attempts"
         )
+        # In case of failures, don't keep the reaction (or a partial answer) there permanently
+        error_calls = [
+            FunctionCall(remove_msg_ack_from_user, (message_info, client, logger))
+        ]
+        if answer_streamer is not None:
+            error_calls.append(FunctionCall(answer_streamer.clean_up))
         # Optionally, respond in thread with the error message, Used primarily
         # for debugging purposes
         if should_respond_with_error_msgs:
-            respond_in_thread(
-                client=client,
-                channel=channel,
-                receiver_ids=None,
-                text=f"Encountered exception when trying to answer: \n\n```{e}```",
-                thread_ts=message_ts_to_respond_to,
+            error_calls.append(
+                FunctionCall(
+                    respond_in_thread,
+                    kwargs={
+                        "client": client,
+                        "channel": channel,
+                        "receiver_ids": None,
+                        "text": f"Encountered exception when trying to answer: \n\n```{e}```",
+                        "thread_ts": message_ts_to_respond_to,
+                    },
+                )
             )
-
-        # In case of failures, don't keep the reaction there permanently
-        try:
-            update_emote_react(
-                emoji=DANSWER_REACT_EMOJI,
-                channel=message_info.channel_to_respond,
-                message_ts=message_info.msg_to_respond,
-                remove=True,
-                client=client,
-            )
-        except SlackApiError as e:
-            logger.error(f"Failed to remove Reaction due to: {e}")
+        run_functions_in_parallel(error_calls)
 
         return True
 
     # Got an answer at this point, can remove reaction and give results
-    try:
-        update_emote_react(
-            emoji=DANSWER_REACT_EMOJI,
-            channel=message_info.channel_to_respond,
-            message_ts=message_info.msg_to_respond,
-            remove=True,
-            client=client,
-        )
-    except SlackApiError as e:
-        logger.error(f"Failed to remove Reaction due to: {e}")
+    remove_ack_call = FunctionCall(
+        remove_msg_ack_from_user, (message_info, client, logger)
+    )
+
+    def _clean_up_without_answer() -> None:
+        """No answer will be sent, don't keep the reaction (or a partial answer) there"""
+        clean_up_calls = [remove_ack_call]
+        if answer_streamer is not None:
+            clean_up_calls.append(FunctionCall(answer_streamer.clean_up))
+        run_functions_in_parallel(clean_up_calls)
 
     if answer.answer_valid is False:
         logger.info(
@@ -342,11 +513,13 @@ def handle_message(
         )
         if answer.answer:
             logger.debug(answer.answer)
+        _clean_up_without_answer()
         return True
 
     retrieval_info = answer.docs
     if not retrieval_info:
         # This should not happen, even with no docs retrieved, there is still info returned
+        _clean_up_without_answer()
         raise RuntimeError("Failed to retrieve docs, cannot answer question.")
 
     top_docs = retrieval_info.top_documents
@@ -354,6 +527,7 @@ def handle_message(
         logger.error(
             f"Unable to answer question: '{answer.rephrase}' - no documents found"
         )
+        _clean_up_without_answer()
         # Optionally, respond in thread with the error message
         # Used primarily for debugging purposes
         if should_respond_with_error_msgs:
@@ -371,10 +545,11 @@ def handle_message(
             "Unable to find answer - not responding since the "
             "`DANSWER_BOT_DISABLE_DOCS_ONLY_ANSWER` env variable is set"
         )
+        _clean_up_without_answer()
         return True
 
     # If called with the DanswerBot slash command, the question is lost so we have to reshow it
-    restate_question_block = get_restate_blocks(messages[-1].message, is_bot_msg)
+    restate_question_block = get_restate_blocks(last_message, is_bot_msg)
 
     answer_blocks = build_qa_response_blocks(
         message_id=answer.chat_message_id,
@@ -389,35 +564,72 @@ def handle_message(
     # Get the chunks fed to the LLM only, then fill with other docs
     llm_doc_inds = answer.llm_chunks_indices or []
     llm_docs = [top_docs[i] for i in llm_doc_inds]
+    llm_doc_inds_set = set(llm_doc_inds)
     remaining_docs = [
-        doc for idx, doc in enumerate(top_docs) if idx not in llm_doc_inds
+        doc for idx, doc in enumerate(top_docs) if idx not in llm_doc_inds_set
     ]
     priority_ordered_docs = llm_docs + remaining_docs
+
+    include_follow_up = bool(
+        channel_conf and channel_conf.get("follow_up_tags") is not None
+    )
+
+    # Slack rejects messages with too many blocks, only show as many docs as fit.
+    # Each doc takes a section and a divider block, plus one header for all of them
+    remaining_blocks = (
+        SLACK_MAX_BLOCKS_PER_MESSAGE
+        - len(restate_question_block)
+        - len(answer_blocks)
+        - int(include_follow_up)
+    )
+    num_docs_to_display = min(num_docs_to_display, (remaining_blocks - 1) // 2)
     document_blocks = (
         build_documents_blocks(
             documents=priority_ordered_docs,
             message_id=answer.chat_message_id,
+            num_docs_to_display=num_docs_to_display,
         )
-        if priority_ordered_docs
+        if priority_ordered_docs and num_docs_to_display > 0
         else []
     )
 
     all_blocks = restate_question_block + answer_blocks + document_blocks
 
-    if channel_conf and channel_conf.get("follow_up_tags") is not None:
+    if include_follow_up:
         all_blocks.append(build_follow_up_block(message_id=answer.chat_message_id))
 
-    try:
-        respond_in_thread(
-            client=client,
-            channel=channel,
-            receiver_ids=send_to,
-            text="Hello! Danswer has some results for you!",
-            blocks=all_blocks,
-            thread_ts=message_ts_to_respond_to,
-            # don't unfurl, since otherwise we will have 5+ previews which makes the message very long
-            unfurl=False,
-        )
+    def _send_answer() -> None:
+        replaced_streamed_answer = False
+        if answer_streamer is not None and answer_streamer.message_ts is not None:
+            # Replace the partially streamed answer with the full response
+            try:
+                update_message(
+                    client=client,
+                    channel=channel,
+                    message_ts=answer_streamer.message_ts,
+                    text="Hello! Danswer has some results for you!",
+                    blocks=all_blocks,
+                    unfurl=False,
+                )
+                replaced_streamed_answer = True
+            except Exception as e:
+                logger.error(
+                    f"Failed to replace streamed answer, posting a new message: {e}"
+                )
+                # Don't leave the truncated answer behind
+                answer_streamer.clean_up()
+
+        if not replaced_streamed_answer:
+            respond_in_thread(
+                client=client,
+                channel=channel,
+                receiver_ids=send_to,
+                text="Hello! Danswer has some results for you!",
+                blocks=all_blocks,
+                thread_ts=message_ts_to_respond_to,
+                # don't unfurl, since otherwise we will have 5+ previews which makes the message very long
+                unfurl=False,
+            )
 
         # For DM (ephemeral message), we need to create a thread via a normal message so the user can see
         # the ephemeral message. This also will give the user a notification which ephemeral message does not.
@@ -432,6 +644,9 @@ def handle_message(
                 thread_ts=message_ts_to_respond_to,
             )
 
+    try:
+        # The reaction is removed while the answer is being sent
+        run_functions_in_parallel([remove_ack_call, FunctionCall(_send_answer)])
         return False
 
     except Exception:
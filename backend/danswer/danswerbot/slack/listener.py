@@ -36,6 +36,7 @@ from danswer.danswerbot.slack.utils import ChannelIdAdapter
 from danswer.danswerbot.slack.utils import decompose_action_id
 from danswer.danswerbot.slack.utils import get_channel_name_from_id
 from danswer.danswerbot.slack.utils import get_danswer_bot_app_id
+from danswer.danswerbot.slack.utils import invalidate_userid_cache
 from danswer.danswerbot.slack.utils import read_slack_thread
 from danswer.danswerbot.slack.utils import remove_danswer_bot_tag
 from danswer.danswerbot.slack.utils import respond_in_thread
@@ -394,6 +395,8 @@ if __name__ == "__main__":
                 if slack_bot_tokens is not None:
                     logger.info("Slack Bot tokens have changed - reconnecting")
                 slack_bot_tokens = latest_slack_bot_tokens
+                # Cached Slack lookups may belong to a different workspace now
+                invalidate_userid_cache()
                 # potentially may cause a message to be dropped, but it is complicated
                 # to avoid + (1) if the user is changing tokens, they are likely okay with some
                 # "migration downtime" and (2) if a single message is lost it is okay
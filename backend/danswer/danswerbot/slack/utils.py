@@ -2,11 +2,15 @@ import logging
 import random
 import re
 import string
+import threading
+import functools
 import time
+from collections.abc import Callable
 from collections.abc import MutableMapping
 from typing import Any
 from typing import cast
 from typing import Optional
+from typing import TypeVar
 
 from retry import retry
 from slack_sdk import WebClient
@@ -35,9 +39,16 @@ from danswer.utils.text_processing import replace_whitespaces_w_space
 
 logger = setup_logger()
 
+RT = TypeVar("RT")  # return type
+
 
 DANSWER_BOT_APP_ID: str | None = None
 
+# Slack user ids looked up by email, (bot token, email) -> (user id, time fetched)
+USER_ID_CACHE_TTL = 60 * 60
+_USER_ID_CACHE: dict[tuple[str | None, str], tuple[str, float]] = {}
+_USER_ID_CACHE_LOCK = threading.Lock()
+
 
 def update_emote_react(
     emoji: str,
@@ -142,6 +153,30 @@ def respond_in_thread(
                 raise RuntimeError(f"Failed to post message: {response}")
 
 
+def update_message(
+    client: WebClient,
+    channel: str,
+    message_ts: str,
+    text: str,
+    blocks: list[Block] | None = None,
+    unfurl: bool = True,
+) -> None:
+    slack_call = make_slack_api_rate_limited(client.chat_update)
+    slack_call(
+        channel=channel,
+        ts=message_ts,
+        text=text,
+        blocks=blocks,
+        unfurl_links=unfurl,
+        unfurl_media=unfurl,
+    )
+
+
+def delete_message(client: WebClient, channel: str, message_ts: str) -> None:
+    slack_call = make_slack_api_rate_limited(client.chat_delete)
+    slack_call(channel=channel, ts=message_ts)
+
+
 def build_feedback_id(
     message_id: int,
     document_id: str | None = None,
@@ -261,15 +296,33 @@ def get_channel_name_from_id(
         raise e
 
 
+def invalidate_userid_cache() -> None:
+    with _USER_ID_CACHE_LOCK:
+        _USER_ID_CACHE.clear()
+
+
 def fetch_userids_from_emails(
     user_emails: list[str], client: WebClient
 ) -> tuple[list[str], list[str]]:
+    """Successful lookups are cached since the emails in the Slack bot configs rarely
+    change, failed lookups are retried on the next call"""
     user_ids: list[str] = []
     failed_to_find: list[str] = []
     for email in user_emails:
+        # Key on the token as well, user ids are only valid within the bot's workspace
+        cache_key = (client.token, email)
+        with _USER_ID_CACHE_LOCK:
+            cached = _USER_ID_CACHE.get(cache_key)
+        if cached is not None and time.time() - cached[1] < USER_ID_CACHE_TTL:
+            user_ids.append(cached[0])
+            continue
+
         try:
             user = client.users_lookupByEmail(email=email)
-            user_ids.append(user.data["user"]["id"])  # type: ignore
+            user_id = user.data["user"]["id"]  # type: ignore
+            user_ids.append(user_id)
+            with _USER_ID_CACHE_LOCK:
+                _USER_ID_CACHE[cache_key] = (user_id, time.time())
         except Exception:
             logger.error(f"Was not able to find slack user by email: {email}")
             failed_to_find.append(email)
@@ -381,13 +434,65 @@ def slack_usage_report(action: str, sender_id: str | None, client: WebClient) ->
     )
 
 
+def retry_within_deadline(
+    tries: int,
+    deadline: float,
+    logger: logging.Logger,
+    delay: float = 0.25,
+    backoff: float = 2,
+    non_retryable_exceptions: tuple[type[Exception], ...] = (
+        ValueError,
+        NotImplementedError,
+    ),
+) -> Callable[[Callable[..., RT]], Callable[..., RT]]:
+    """Like `retry.retry` but stops retrying once the next attempt would start after
+    `deadline` seconds since the first one. Errors that will not go away by retrying
+    (bad inputs, unsupported flows) are raised immediately."""
+
+    def decorator(func: Callable[..., RT]) -> Callable[..., RT]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> RT:
+            start_time = time.monotonic()
+            next_delay = delay
+            for attempt in range(1, tries + 1):
+                try:
+                    return func(*args, **kwargs)
+                except non_retryable_exceptions:
+                    raise
+                except Exception as e:
+                    if attempt == tries:
+                        raise
+                    if time.monotonic() - start_time + next_delay > deadline:
+                        logger.warning(
+                            f"{e}, not retrying since the time limit of {deadline} "
+                            "seconds would be exceeded"
+                        )
+                        raise
+
+                    logger.warning(f"{e}, retrying in {next_delay} seconds...")
+                    time.sleep(next_delay)
+                    next_delay *= backoff
+
+            raise RuntimeError("Programming fault, this should never happen.")
+
+        return wrapper
+
+    return decorator
+
+
 class SlackRateLimiter:
+    """Limits the number of questions answered per minute. Questions beyond the limit
+    are queued and answered in order, waiters sleep until a slot can actually be
+    available (the next refill or the queue moving) instead of polling"""
+
     def __init__(self) -> None:
         self.max_qpm: int | None = DANSWER_BOT_MAX_QPM
         self.max_wait_time = DANSWER_BOT_MAX_WAIT_TIME
         self.active_question = 0
         self.last_reset_time = time.time()
         self.waiting_questions: list[int] = []
+        # Guards all of the above, questions are handled in multiple threads
+        self._condition = threading.Condition()
 
     def refill(self) -> None:
         # If elapsed time is greater than the period, reset the active question count
@@ -395,48 +500,74 @@ class SlackRateLimiter:
             self.active_question = 0
             self.last_reset_time = time.time()
 
+    def _time_until_refill(self) -> float:
+        return max(self.last_reset_time + 60 - time.time(), 0)
+
     def notify(
         self, client: WebClient, channel: str, position: int, thread_ts: Optional[str]
     ) -> None:
-        respond_in_thread(
-            client=client,
-            channel=channel,
-            receiver_ids=None,
-            text=f"Your question has been queued. You are in position {position}.\n"
-            f"Please wait a moment :hourglass_flowing_sand:",
-            thread_ts=thread_ts,
-        )
+        # Only informs the user, failing to post it must not leave the waiter queued
+        # without anyone waiting on it, which would block every question behind it
+        try:
+            respond_in_thread(
+                client=client,
+                channel=channel,
+                receiver_ids=None,
+                text=f"Your question has been queued. You are in position {position}.\n"
+                f"Please wait a moment :hourglass_flowing_sand:",
+                thread_ts=thread_ts,
+            )
+        except Exception:
+            logger.exception("Failed to notify user that their question is queued")
 
-    def is_available(self) -> bool:
+    def try_acquire_slot(self) -> bool:
+        """Takes a slot if one is free and no earlier question is queued for it"""
         if self.max_qpm is None:
             return True
 
-        self.refill()
-        return self.active_question < self.max_qpm
-
-    def acquire_slot(self) -> None:
-        self.active_question += 1
+        with self._condition:
+            self.refill()
+            if self.waiting_questions or self.active_question >= self.max_qpm:
+                return False
+            self.active_question += 1
+            return True
 
     def init_waiter(self) -> tuple[int, int]:
         func_randid = random.getrandbits(128)
-        self.waiting_questions.append(func_randid)
-        position = self.waiting_questions.index(func_randid) + 1
+        with self._condition:
+            self.waiting_questions.append(func_randid)
+            position = len(self.waiting_questions)
 
         return func_randid, position
 
     def waiter(self, func_randid: int) -> None:
+        """Blocks until the waiter is first in the queue and a slot is free, then takes
+        the slot. Raises a TimeoutError if this takes longer than the max wait time"""
         if self.max_qpm is None:
             return
 
-        wait_time = 0
-        while (
-            self.active_question >= self.max_qpm
-            or self.waiting_questions[0] != func_randid
-        ):
-            if wait_time > self.max_wait_time:
-                raise TimeoutError
-            time.sleep(2)
-            wait_time += 2
-            self.refill()
-
-        del self.waiting_questions[0]
+        deadline = time.time() + self.max_wait_time
+        with self._condition:
+            try:
+                while True:
+                    self.refill()
+                    if (
+                        self.active_question < self.max_qpm
+                        and self.waiting_questions[0] == func_randid
+                    ):
+                        self.active_question += 1
+                        return
+
+                    remaining_wait = deadline - time.time()
+                    if remaining_wait <= 0:
+                        raise TimeoutError
+
+                    # Slots only free up on refill, unless the queue moves in between
+                    self._condition.wait(
+                        timeout=min(remaining_wait, self._time_until_refill())
+                    )
+            finally:
+                # Whether the slot was taken or the wait timed out, leave the queue
+                # and let the next waiter check if it is its turn
+                self.waiting_questions.remove(func_randid)
+                self._condition.notify_all()
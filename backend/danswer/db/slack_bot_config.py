@@ -1,6 +1,7 @@
 from collections.abc import Sequence
 
 from sqlalchemy import select
+from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import Session
 
 from danswer.configs.chat_configs import MAX_CHUNKS_FED_TO_CHAT
@@ -163,5 +164,16 @@ def fetch_slack_bot_config(
     )
 
 
-def fetch_slack_bot_configs(db_session: Session) -> Sequence[SlackBotConfig]:
-    return db_session.scalars(select(SlackBotConfig)).all()
+def fetch_slack_bot_configs(
+    db_session: Session, eager_load_persona: bool = False
+) -> Sequence[SlackBotConfig]:
+    """If eager_load_persona is set, the persona along with its document sets and prompts
+    are loaded in the same query, this is used by the Slack bot which reads all of them
+    for every message it answers"""
+    stmt = select(SlackBotConfig)
+    if eager_load_persona:
+        stmt = stmt.options(
+            joinedload(SlackBotConfig.persona).joinedload(Persona.document_sets),
+            joinedload(SlackBotConfig.persona).joinedload(Persona.prompts),
+        )
+    return db_session.scalars(stmt).unique().all()
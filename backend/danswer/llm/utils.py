@@ -1,6 +1,7 @@
 from collections.abc import Callable
 from collections.abc import Iterator
 from copy import copy
+from functools import lru_cache
 from typing import Any
 from typing import cast
 
@@ -50,11 +51,11 @@ def get_default_llm_token_encode() -> Callable[[str], Any]:
     global _LLM_TOKENIZER_ENCODE
     if _LLM_TOKENIZER_ENCODE is None:
         tokenizer = get_default_llm_tokenizer()
-        if isinstance(tokenizer, Encoding):
-            return tokenizer.encode  # type: ignore
+        if not isinstance(tokenizer, Encoding):
+            # Currently only supports OpenAI encoder
+            raise ValueError("Invalid Encoder selected")
 
-        # Currently only supports OpenAI encoder
-        raise ValueError("Invalid Encoder selected")
+        _LLM_TOKENIZER_ENCODE = tokenizer.encode
 
     return _LLM_TOKENIZER_ENCODE
 
@@ -166,16 +167,22 @@ def should_be_verbose() -> bool:
     return LOG_LEVEL == "debug"
 
 
+@lru_cache(maxsize=4096)
+def _check_number_of_tokens_default_encoder(text: str) -> int:
+    return len(get_default_llm_token_encode()(text))
+
+
 def check_number_of_tokens(
     text: str, encode_fn: Callable[[str], list] | None = None
 ) -> int:
     """Gets the number of tokens in the provided text, using the provided encoding
     function. If none is provided, default to the tiktoken encoder used by GPT-3.5
-    and GPT-4.
+    and GPT-4. Counts with the default encoder are cached since the same texts
+    (prompts, chunks, user queries on retries) tend to get counted repeatedly.
     """
 
     if encode_fn is None:
-        encode_fn = tiktoken.get_encoding("cl100k_base").encode
+        return _check_number_of_tokens_default_encoder(text)
 
     return len(encode_fn(text))
 
@@ -203,6 +210,7 @@ def test_llm(llm: LLM) -> bool:
     return False
 
 
+@lru_cache()
 def get_llm_max_tokens(model_name: str | None = GEN_AI_MODEL_VERSION) -> int:
     """Best effort attempt to get the max tokens for the LLM"""
     if not model_name:
@@ -214,6 +222,7 @@ def get_llm_max_tokens(model_name: str | None = GEN_AI_MODEL_VERSION) -> int:
         return GEN_AI_MAX_TOKENS
 
 
+@lru_cache()
 def get_max_input_tokens(
     model_name: str | None = GEN_AI_MODEL_VERSION,
     output_tokens: int = GEN_AI_MAX_OUTPUT_TOKENS,
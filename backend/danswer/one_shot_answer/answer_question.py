@@ -334,8 +334,10 @@ def get_search_answer(
     | None = None,
     rerank_metrics_callback: Callable[[RerankMetricsContainer], None] | None = None,
     llm_metrics_callback: Callable[[LLMMetricsContainer], None] | None = None,
+    answer_piece_callback: Callable[[str], None] | None = None,
 ) -> OneShotQAResponse:
-    """Collects the streamed one shot answer responses into a single object"""
+    """Collects the streamed one shot answer responses into a single object
+    answer_piece_callback is called with each piece of the answer as it is generated"""
     qa_response = OneShotQAResponse()
 
     results = stream_answer_objects(
@@ -357,6 +359,8 @@ def get_search_answer(
             qa_response.rephrase = packet.rephrased_query
         if isinstance(packet, DanswerAnswerPiece) and packet.answer_piece:
             answer += packet.answer_piece
+            if answer_piece_callback is not None:
+                answer_piece_callback(packet.answer_piece)
         elif isinstance(packet, QADocsResponse):
             qa_response.docs = packet
         elif isinstance(packet, LLMRelevanceFilterResponse):
@@ -19,6 +19,12 @@ class ThreadMessage(BaseModel):
     sender: str | None
     role: MessageType
 
+    class Config:
+        frozen = True
+        # Immutable so it's safe to share the same instance when nested in other models
+        # (e.g. SlackMessageInfo), avoids copying every message of long threads
+        copy_on_model_validation = "none"
+
 
 class DirectQARequest(BaseModel):
     messages: list[ThreadMessage]
@@ -28,6 +34,9 @@ class DirectQARequest(BaseModel):
     chain_of_thought: bool = False
     return_contexts: bool = False
 
+    class Config:
+        frozen = True
+
     @root_validator
     def check_chain_of_thought_and_prompt_id(
         cls, values: dict[str, Any]
@@ -78,6 +78,10 @@ ANSWER_NOT_FOUND_RESPONSE = f'{{"answer": "{UNCERTAINTY_PAT}", "quotes": []}}'
 # system_like_header is similar to system message, can be user provided or defaults to QA_HEADER
 # context/history blocks are for context documents and conversation history, they can be blank
 # task prompt is the task message of the prompt, can be blank, there is no default
+# NOTE: the system prompt + REQUIRE_JSON must stay the literal start of the prompt, nothing
+# that varies per request (context, history, query) should be placed before it. The same
+# persona is used for every message in a Slack channel, so keeping this static prefix stable
+# lets providers with automatic prompt prefix caching (e.g. OpenAI) reuse it across calls
 JSON_PROMPT = f"""
 {{system_prompt}}
 {REQUIRE_JSON}
@@ -51,7 +51,9 @@ def retrieval_preprocessing(
     Then defaults to Persona settings if not specified by the query
     """
 
-    preset_filters = retrieval_details.filters or BaseFilters()
+    # Copy so the Persona defaults below don't get written into the caller's (possibly
+    # shared) retrieval details
+    preset_filters = (retrieval_details.filters or BaseFilters()).copy()
     if persona and persona.document_sets and preset_filters.document_set is None:
         preset_filters.document_set = [
             document_set.name for document_set in persona.document_sets
@@ -0,0 +1,159 @@
+import time
+import unittest
+from collections.abc import Callable
+from threading import Thread
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from danswer.danswerbot.slack.utils import SlackRateLimiter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+class TestSlackRateLimiter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        time_patcher = patch("danswer.danswerbot.slack.utils.time", self.clock)
+        time_patcher.start()
+        self.addCleanup(time_patcher.stop)
+
+        self.limiter = SlackRateLimiter()
+        self.limiter.max_qpm = 1
+        self.limiter.max_wait_time = 10
+        self.threads: list[Thread] = []
+
+    def tearDown(self) -> None:
+        for thread in self.threads:
+            thread.join(timeout=5)
+
+    def _advance(self, seconds: float) -> None:
+        self.clock.now += seconds
+        # Waiters sleep until the next refill in (fake) time, wake them up to re-check
+        with self.limiter._condition:
+            self.limiter._condition.notify_all()
+
+    def _start_waiter(self, func_randid: int, name: str, results: list[str]) -> Thread:
+        def _wait() -> None:
+            try:
+                self.limiter.waiter(func_randid)
+                results.append(name)
+            except TimeoutError:
+                results.append(f"{name}-timeout")
+
+        thread = Thread(target=_wait, daemon=True)
+        thread.start()
+        self.threads.append(thread)
+        return thread
+
+    @staticmethod
+    def _wait_until(condition: Callable[[], bool]) -> None:
+        deadline = time.time() + 5
+        while not condition():
+            if time.time() > deadline:
+                raise AssertionError("Condition was not met in time")
+            time.sleep(0.01)
+
+    def test_acquire_until_limit(self) -> None:
+        self.assertTrue(self.limiter.try_acquire_slot())
+        self.assertFalse(self.limiter.try_acquire_slot())
+
+        self._advance(61)
+        self.assertTrue(self.limiter.try_acquire_slot())
+
+    def test_waiters_are_served_in_order(self) -> None:
+        self.limiter.max_wait_time = 1000
+        self.assertTrue(self.limiter.try_acquire_slot())
+
+        first_id, first_position = self.limiter.init_waiter()
+        second_id, second_position = self.limiter.init_waiter()
+        self.assertEqual((first_position, second_position), (1, 2))
+
+        results: list[str] = []
+        # Start the later waiter first, the queue order should decide, not the thread order
+        self._start_waiter(second_id, "second", results)
+        self._start_waiter(first_id, "first", results)
+        time.sleep(0.1)
+        self.assertEqual(results, [])
+
+        self._advance(61)
+        self._wait_until(lambda: len(results) == 1)
+        time.sleep(0.1)
+        self.assertEqual(results, ["first"])
+
+        self._advance(61)
+        self._wait_until(lambda: len(results) == 2)
+        self.assertEqual(results, ["first", "second"])
+        self.assertEqual(self.limiter.waiting_questions, [])
+
+    def test_timed_out_waiter_leaves_queue(self) -> None:
+        self.assertTrue(self.limiter.try_acquire_slot())
+        # Next refill is 15 seconds away
+        self.limiter.last_reset_time = self.clock.now - 45
+
+        first_id, _ = self.limiter.init_waiter()
+        second_id, _ = self.limiter.init_waiter()
+
+        results: list[str] = []
+        self._start_waiter(first_id, "first", results)
+        time.sleep(0.1)
+        self._advance(8)
+        # Deadline of the second waiter is 8 seconds later than the first one's
+        self._start_waiter(second_id, "second", results)
+        time.sleep(0.1)
+
+        # Past the first waiter's deadline but before the refill
+        self._advance(2.5)
+        self._wait_until(lambda: len(results) == 1)
+        self.assertEqual(results, ["first-timeout"])
+        self.assertEqual(self.limiter.waiting_questions, [second_id])
+
+        # Refill happens, the next waiter is no longer blocked by the timed out one
+        self._advance(5.5)
+        self._wait_until(lambda: len(results) == 2)
+        self.assertEqual(results, ["first-timeout", "second"])
+        self.assertEqual(self.limiter.waiting_questions, [])
+
+    def test_new_arrival_does_not_skip_queue(self) -> None:
+        self.assertTrue(self.limiter.try_acquire_slot())
+        queued_id, _ = self.limiter.init_waiter()
+
+        # A slot is free again, but it belongs to the queued question
+        self._advance(61)
+        self.assertFalse(self.limiter.try_acquire_slot())
+        self.assertEqual(self.limiter.active_question, 0)
+
+        self.limiter.waiter(queued_id)
+        self.assertEqual(self.limiter.active_question, 1)
+        self.assertEqual(self.limiter.waiting_questions, [])
+
+    def test_failed_notify_does_not_block_queue(self) -> None:
+        self.assertTrue(self.limiter.try_acquire_slot())
+        func_randid, position = self.limiter.init_waiter()
+
+        with patch(
+            "danswer.danswerbot.slack.utils.respond_in_thread",
+            side_effect=RuntimeError("Slack is down"),
+        ):
+            self.limiter.notify(MagicMock(), "channel", position, None)
+        self.limiter.waiter(func_randid)
+
+        # The slot was handed to the queued question, after the refill nothing is
+        # left in the queue to hold back new questions
+        self.assertEqual(self.limiter.waiting_questions, [])
+        self._advance(61)
+        self.assertTrue(self.limiter.try_acquire_slot())
+
+    def test_unlimited(self) -> None:
+        self.limiter.max_qpm = None
+        for _ in range(100):
+            self.assertTrue(self.limiter.try_acquire_slot())
+
+
+if __name__ == "__main__":
+    unittest.main()
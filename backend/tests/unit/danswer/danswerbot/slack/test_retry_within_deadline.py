@@ -0,0 +1,82 @@
+import logging
+import unittest
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from danswer.danswerbot.slack.utils import retry_within_deadline
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestRetryWithinDeadline(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        time_patcher = patch("danswer.danswerbot.slack.utils.time", self.clock)
+        time_patcher.start()
+        self.addCleanup(time_patcher.stop)
+
+        self.logger = logging.getLogger(__name__)
+
+    def test_non_retryable_raised_immediately(self) -> None:
+        func = MagicMock(side_effect=ValueError("bad input"))
+        wrapped = retry_within_deadline(tries=5, deadline=100, logger=self.logger)(
+            func
+        )
+
+        with self.assertRaises(ValueError):
+            wrapped()
+        self.assertEqual(func.call_count, 1)
+        self.assertEqual(self.clock.sleeps, [])
+
+    def test_stops_before_exceeding_deadline(self) -> None:
+        def _slow_failure() -> None:
+            self.clock.now += 1
+            raise RuntimeError("LLM call failed")
+
+        func = MagicMock(side_effect=_slow_failure)
+        wrapped = retry_within_deadline(
+            tries=10, deadline=5, logger=self.logger, delay=1, backoff=2
+        )(func)
+
+        # Attempt 1 ends at 1s, sleeps 1s; attempt 2 ends at 3s, sleeping 2s more
+        # would start the next attempt at 5s which is still allowed; attempt 3 ends
+        # at 6s and 6 + 4 > 5 so no further attempt is made
+        with self.assertRaises(RuntimeError):
+            wrapped()
+        self.assertEqual(func.call_count, 3)
+        self.assertEqual(self.clock.sleeps, [1, 2])
+
+    def test_stops_after_max_tries(self) -> None:
+        func = MagicMock(side_effect=RuntimeError("LLM call failed"))
+        wrapped = retry_within_deadline(
+            tries=3, deadline=1000, logger=self.logger, delay=1, backoff=2
+        )(func)
+
+        with self.assertRaises(RuntimeError):
+            wrapped()
+        self.assertEqual(func.call_count, 3)
+        self.assertEqual(self.clock.sleeps, [1, 2])
+
+    def test_returns_after_transient_failure(self) -> None:
+        func = MagicMock(side_effect=[RuntimeError("LLM call failed"), "answer"])
+        wrapped = retry_within_deadline(tries=3, deadline=100, logger=self.logger)(
+            func
+        )
+
+        self.assertEqual(wrapped(), "answer")
+        self.assertEqual(func.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()